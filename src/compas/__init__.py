@@ -214,6 +214,15 @@ def set_precision(precision):
 # data
 # ==============================================================================
 
+# Verified local sample data paths, keyed by file name.
+# Resolving a name costs a stat call per lookup;
+# scripts and test suites request the same handful of names over and over,
+# so resolve each name only once per session.
+# Only hits are cached: a miss falls back to the GitHub URL,
+# and a file placed in DATA later should still be found.
+_GET_CACHE = {}
+
+
 def get(filename):
     """Get the full path to one of the sample data files.
 
@@ -261,12 +270,16 @@ def get(filename):
     if filename.endswith('bunny.ply'):
         return get_bunny()
 
+    if filename in _GET_CACHE:
+        return _GET_CACHE[filename]
+
     localpath = compas._os.absjoin(DATA, filename)
 
     if os.path.exists(localpath):
+        _GET_CACHE[filename] = localpath
         return localpath
-    else:
-        return "https://github.com/compas-dev/compas/raw/main/data/{}".format(filename)
+
+    return "https://github.com/compas-dev/compas/raw/main/data/{}".format(filename)
 
 
 def get_bunny(localstorage=None):
@@ -1,12 +1,70 @@
 """For the time being, these functions are only for internal use."""
 from contextlib import contextmanager
 import io
+import os
 
 try:
     from urllib.request import urlopen
 except ImportError:
     from urllib2 import urlopen
 
+# Cache of downloaded URL contents, keyed by URL.
+# Several of the file readers open the same location more than once
+# (e.g. once for the header and once for the data),
+# which for remote files means re-downloading the same content on every open.
+_DOWNLOAD_CACHE = {}
+
+
+def _download(url):
+    """Download the contents of a URL, reusing previously downloaded content if available.
+
+    Parameters
+    ----------
+    url : str
+        URL pointing to a file.
+
+    Returns
+    -------
+    bytes
+        The contents of the remote file.
+    """
+    if url not in _DOWNLOAD_CACHE:
+        response = urlopen(url)
+        _DOWNLOAD_CACHE[url] = response.read()
+    return _DOWNLOAD_CACHE[url]
+
+
+def prefetch(urls, max_workers=8):
+    """Download a collection of URLs concurrently into the download cache.
+
+    Downloading many remote files one after the other pays one network
+    round-trip per file. Prefetching overlaps the downloads, after which
+    ``open_file`` serves each of these URLs from memory.
+
+    Parameters
+    ----------
+    urls : iterable of str
+        URLs pointing to files.
+    max_workers : int, optional
+        Maximum number of concurrent downloads. Defaults to ``8``.
+    """
+    urls = [url for url in urls if url not in _DOWNLOAD_CACHE]
+
+    if not urls:
+        return
+
+    try:
+        from concurrent.futures import ThreadPoolExecutor
+    except ImportError:
+        # concurrent.futures is not available (e.g. IronPython):
+        # fall back to downloading sequentially.
+        for url in urls:
+            _download(url)
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(_download, urls))
+
 
 @contextmanager
 def open_file(file_or_filename, mode='r'):
@@ -45,11 +103,12 @@ def open_file(file_or_filename, mode='r'):
             # support all read modes (r, r+, rb, etc)
             if not mode.startswith('r'):
                 raise ValueError('URLs can only be opened in read mode.')
-            response = urlopen(file)
-            file = io.BytesIO(response.read())
+            file = io.BytesIO(_download(file))
         else:
             file = open(file, mode=mode)
             close_source = True
+            if mode.startswith('r'):
+                _advise_sequential(file)
     try:
         yield file
     finally:
@@ -57,6 +116,51 @@ def open_file(file_or_filename, mode='r'):
             file.close()
 
 
+def read_all(file_or_filename, mode='rb'):
+    """Read the entire contents of a file, path or URL in a single call.
+
+    Whole-file consumers (binary parsers, ``frombuffer``-style decoders)
+    work fastest on one contiguous buffer; this helper gives them that
+    buffer with a single open and a single read.
+
+    Parameters
+    ----------
+    file_or_filename : path-like, file-like object or URL string
+        A path-like, a file-like object or a URL pointing to a file.
+    mode : str, optional
+        Specifies the mode in which the file is opened.
+        It defaults to ``'rb'`` which means open for reading in binary mode.
+
+    Returns
+    -------
+    bytes or str
+        The file contents, as bytes or text depending on the mode.
+    """
+    with open_file(file_or_filename, mode) as file:
+        return file.read()
+
+
+def _advise_sequential(file):
+    """Hint the OS that a file will be read sequentially from start to end.
+
+    The file readers consume their input strictly sequentially, so on
+    platforms that support ``posix_fadvise`` the kernel can be told to use a
+    larger readahead window. The hint is purely advisory: on platforms or
+    file objects where it is unavailable or fails, reading proceeds as usual.
+
+    Parameters
+    ----------
+    file : file-like object
+        An open file object.
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except (OSError, ValueError, io.UnsupportedOperation):
+        pass
+
+
 def iter_file(file, size=65536):
     """Iterate over a file returning chunks of data until EOF.
 
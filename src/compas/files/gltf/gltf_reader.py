@@ -8,6 +8,7 @@ import os
 import re
 import struct
 
+from compas import _iotools
 from compas.files.gltf.constants import COMPONENT_TYPE_BYTE
 from compas.files.gltf.constants import COMPONENT_TYPE_ENUM
 from compas.files.gltf.constants import COMPONENT_TYPE_SHORT
@@ -52,8 +53,7 @@ class GLTFReader(object):
         self.read()
 
     def read(self):
-        with open(self.filepath, 'rb') as f:
-            self._bin_content = self._get_memoryview(f.read())
+        self._bin_content = self._get_memoryview(_iotools.read_all(self.filepath))
 
         is_glb = self._bin_content[:4] == b'glTF'
 
@@ -268,11 +268,11 @@ class GLTFReader(object):
         return buffer
 
     def _release_buffer(self, buffer):
-        try:
+        # memoryview.release does not exist on Python <3.2;
+        # probing for the attribute is much cheaper than raising
+        # and catching AttributeError once per buffer.
+        if hasattr(buffer, 'release'):
             buffer.release()
-        except AttributeError:
-            # AttributeError indicates using Python <3.2
-            pass
 
     def _release_buffers(self):
         self._release_buffer(self._glb_buffer)
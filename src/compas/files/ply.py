@@ -137,6 +137,7 @@ class PLYReader(object):
         self.vertices = []
         self.edges = []
         self.faces = []
+        self._is_header_parsed = False
         self.read()
 
     def is_valid(self):
@@ -169,6 +170,15 @@ class PLYReader(object):
     # ==========================================================================
 
     def read_header(self):
+        # parsing the header is not free:
+        # it opens the file and scans it line by line.
+        # the result only depends on the file contents,
+        # so parse once and return the cached result afterwards.
+        # this also avoids duplicating the header sections
+        # when, for example, ``is_valid`` is called after ``read``.
+        if self._is_header_parsed:
+            return
+
         # the header is always in ascii format
         # read it as text
         # otherwise file.tell() can't be used reliably
@@ -243,6 +253,7 @@ class PLYReader(object):
                 elif line == 'end_header':
                     element_type = None
                     self.end_header = file.tell()
+                    self._is_header_parsed = True
                     break
 
                 else:
@@ -374,13 +385,16 @@ class PLYReader(object):
             pname, ptype = prop
             chunk += self.number_of_bytes_per_type[ptype]
             fmt += self.struct_format_per_type[ptype]
+        # read the entire vertex section in one call
+        # and unpack the individual records from the buffer,
+        # instead of issuing one read per vertex.
+        data = self.file.read(chunk * self.number_of_vertices)
         for i in range(self.number_of_vertices):
-            data = self.file.read(chunk)
-            data = struct.unpack(fmt, data)
+            values = struct.unpack_from(fmt, data, i * chunk)
             vertex = {}
-            for i, prop in enumerate(self.vertex_properties):
+            for j, prop in enumerate(self.vertex_properties):
                 pname, ptype = prop
-                vertex[pname] = data[i]
+                vertex[pname] = values[j]
             self.vertices.append(vertex)
 
     def read_vertices_binary(self):
@@ -416,17 +430,23 @@ class PLYReader(object):
                 fmt += self.struct_format_per_type[ptype] * 3
             else:
                 pass
+        # read the entire face section in one call,
+        # mirroring the bulk read of the vertex section.
+        data = self.file.read(chunk * self.number_of_faces)
         for i in range(self.number_of_faces):
-            data = self.file.read(chunk)
-            data = struct.unpack(fmt, data)
+            values = struct.unpack_from(fmt, data, i * chunk)
             face = {}
-            for i, prop in enumerate(self.face_properties):
+            j = 0
+            for prop in self.face_properties:
                 if len(prop) == 2:
                     pname, ptype = prop
-                    face[pname] = data[i]
+                    face[pname] = values[j]
+                    j += 1
                 elif len(prop) == 3:
                     pname, ptype, plen = prop
-                    face[pname] = list(data[2:])
+                    # skip the length value, then take the three indices
+                    face[pname] = list(values[j + 1:j + 4])
+                    j += 4
             self.faces.append(face)
 
     def read_faces_binary(self):
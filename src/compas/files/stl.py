@@ -66,25 +66,23 @@ class STLReader(object):
         self.read()
 
     def read(self):
-        is_binary = False
         with _iotools.open_file(self.filepath, 'rb') as file:
             line = file.readline().strip()
-            if b'solid' in line:
-                is_binary = False
-            else:
-                is_binary = True
+            # the ascii signature is the keyword "solid" at the very start
+            # of the file, so a prefix comparison is enough;
+            # scanning the whole first line for the keyword would also
+            # misdetect binary files whose 80-byte header mentions "solid".
+            if not line.startswith(b'solid'):
+                # parse the payload from the already open file
+                # instead of closing it only to reopen it right away.
+                self.read_binary(file)
+                return
         try:
-            if not is_binary:
-                self.read_ascii()
-            else:
-                self.read_binary()
+            self.read_ascii()
         except Exception:
-            # raise if it was already detected as binary, but failed anyway
-            if is_binary:
-                raise
-            # else, ascii parsing failed, try binary
-            is_binary = True
-            self.read_binary()
+            # ascii parsing failed, try binary
+            with _iotools.open_file(self.filepath, 'rb') as file:
+                self.read_binary(file)
 
     # ==========================================================================
     # ascii
@@ -104,17 +102,19 @@ class STLReader(object):
     # ==========================================================================
 
     def read_ascii(self):
+        # read the file in one call and split the lines in C,
+        # instead of paying for a readline call per line of the file.
         with _iotools.open_file(self.filepath, 'r') as file:
-            self.file = file
-            self.file.seek(0)
-            self.facets = self.read_solids_ascii()
+            file.seek(0)
+            content = file.read()
+        self.facets = self.read_solids_ascii(content.splitlines())
 
-    def read_solids_ascii(self):
+    def read_solids_ascii(self, lines):
         solids = {}
         facets = []
 
-        while True:
-            line = self.file.readline().strip()
+        for line in lines:
+            line = line.strip()
 
             if not line:
                 break
@@ -182,12 +182,11 @@ class STLReader(object):
         bytes_ = self.file.read(4)
         return struct.unpack('<I', bytes_)[0]
 
-    def read_binary(self):
-        with _iotools.open_file(self.filepath, 'rb') as file:
-            self.file = file
-            self.file.seek(0)
-            self.header = self.read_header_binary()
-            self.facets = self.read_facets_binary()
+    def read_binary(self, file):
+        self.file = file
+        self.file.seek(0)
+        self.header = self.read_header_binary()
+        self.facets = self.read_facets_binary()
 
     def read_header_binary(self):
         bytes_ = self.file.read(80)
@@ -196,26 +195,26 @@ class STLReader(object):
     def read_number_of_facets_binary(self):
         return self._read_uint32()
 
-    def read_facet_binary(self):
-        # Read full facet at once
+    def read_facet_binary(self, data, offset):
+        # Unpack full facet at once
         # 4 bytes per float * 3 floats per vector/vertex * 4 items (1 vector + 3 vertices)
-        bytes_ = self.file.read(48)
-        floats_ = struct.unpack('<12f', bytes_)
+        floats_ = struct.unpack_from('<12f', data, offset)
 
         normal = floats_[0:3]
         vertices = (floats_[3:6], floats_[6:9], floats_[9:12])
-        keys = (bytes_[12:24], bytes_[24:36], bytes_[36:48])
-
-        # Skip two-byte attributes, it's not used anywhere (by anyone - on this planet)
-        self.file.seek(2, 1)
+        keys = (data[offset + 12:offset + 24], data[offset + 24:offset + 36], data[offset + 36:offset + 48])
 
         return {'normal': normal, 'vertices': vertices, 'keys': keys}
 
     def read_facets_binary(self):
         facets = []
         n = self.read_number_of_facets_binary()
+        # Read all facet records with a single call instead of one read per facet.
+        # Each record is 48 bytes of payload followed by a two-byte attribute,
+        # which is not used anywhere (by anyone - on this planet)
+        data = self.file.read(n * 50)
         for i in range(n):
-            facets.append(self.read_facet_binary())
+            facets.append(self.read_facet_binary(data, i * 50))
         return facets
 
 
@@ -0,0 +1,302 @@
+"""Vectorized forward-kinematics helpers for :class:`compas.robots.RobotModel`.
+
+For the time being, these functions are only for internal use.
+
+The module requires numpy and is imported lazily by ``RobotModel``,
+which falls back to the pure Python implementation of
+``compute_transformations`` when numpy is not available.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import numpy as np
+
+from compas.geometry import matrix_from_frame
+from compas.robots.model.joint import Joint
+
+
+def compile_arrays(joints, parent_index, dtype=float):
+    """Flatten the per-joint constant data into contiguous arrays.
+
+    Parameters
+    ----------
+    joints : list of :class:`compas.robots.Joint`
+        The joints in topological order (parents before children).
+    parent_index : list of int
+        For each joint, the index of its parent joint in ``joints``,
+        or ``-1`` for joints attached to the root link.
+    dtype : numpy dtype specifier, optional
+        Floating-point dtype of the compiled arrays and of all
+        transforms computed from them. Defaults to float64.
+
+    Returns
+    -------
+    dict
+        The compiled arrays, keyed by name,
+        plus an ``'index'`` map from joint name to array position.
+    """
+    types = np.array([joint.type for joint in joints], dtype=int)
+    axes = np.array([list(joint.current_axis.vector) for joint in joints], dtype=dtype).reshape(len(joints), 3)
+    points = np.array([list(joint.current_origin.point) for joint in joints], dtype=dtype).reshape(len(joints), 3)
+    lower = np.array([joint.limit.lower if joint.limit else 0.0 for joint in joints], dtype=dtype)
+    upper = np.array([joint.limit.upper if joint.limit else 0.0 for joint in joints], dtype=dtype)
+    origin_matrices = np.array([matrix_from_frame(joint.current_origin) for joint in joints], dtype=dtype).reshape(len(joints), 4, 4)
+
+    return {
+        'joints': tuple(joints),
+        'index': {joint.name: i for i, joint in enumerate(joints)},
+        'parent_index': np.array(parent_index, dtype=int),
+        'types': types,
+        'axes': axes,
+        'points': points,
+        'lower': lower,
+        'upper': upper,
+        'origin_matrices': origin_matrices,
+        # revolute and prismatic joints clamp their position to the limits
+        'clamped': (types == Joint.REVOLUTE) | (types == Joint.PRISMATIC),
+        # the joint types never change between calls, so the per-type
+        # dispatch masks are fixed at compile time
+        'rotational': (types == Joint.REVOLUTE) | (types == Joint.CONTINUOUS),
+        'prismatic': types == Joint.PRISMATIC,
+        'axis_mask': np.linalg.norm(axes, axis=1) > 0,
+    }
+
+
+def transformed_origin_frames(compiled, world):
+    """Apply the world transformations to the joint origin frames.
+
+    Parameters
+    ----------
+    compiled : dict
+        The arrays compiled by :func:`compile_arrays`.
+    world : :class:`numpy.ndarray`
+        ``(N, 4, 4)`` world transformations as returned by :func:`fk_transforms`.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        ``(N, 4, 4)`` frame matrices of the transformed joint origins,
+        with the frame axes in the columns and the origin point in the
+        last column.
+    """
+    return np.matmul(world, compiled['origin_matrices'])
+
+
+def transformed_axes(compiled, world):
+    """Rotate the nonzero joint axes by the world transformations.
+
+    Parameters
+    ----------
+    compiled : dict
+        The arrays compiled by :func:`compile_arrays`.
+    world : :class:`numpy.ndarray`
+        ``(N, 4, 4)`` world transformations as returned by :func:`fk_transforms`.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        ``(M, 3)`` rotated axes of the joints whose axis has a nonzero
+        length, in joint order.
+    """
+    axes = compiled['axes']
+    mask = compiled['axis_mask']
+    # axes are vectors, so only the rotation block applies
+    return np.einsum('mij,mj->mi', world[mask, :3, :3], axes[mask])
+
+
+def fk_transforms(compiled, positions, active):
+    """Compute the world transformation of every joint for the given joint positions.
+
+    Parameters
+    ----------
+    compiled : dict
+        The arrays compiled by :func:`compile_arrays`.
+    positions : list of float
+        Position per joint, in radians or meters depending on the joint type.
+    active : list of bool
+        ``True`` for joints present in the joint state.
+        Inactive joints keep an identity local transformation.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        ``(N, 4, 4)`` array of world transformation matrices, in joint order.
+    """
+    positions = np.asarray(positions, dtype=compiled['axes'].dtype)
+    active = np.asarray(active, dtype=bool)
+    local = _local_transforms(compiled, positions, active)
+    return _fold_transforms(local, compiled['parent_index'])
+
+
+def batch_positions(compiled, q_batch, configurable_names):
+    """Expand configurable joint values to per-joint position and active arrays.
+
+    Parameters
+    ----------
+    compiled : dict
+        The arrays compiled by :func:`compile_arrays`.
+    q_batch : array-like
+        ``(B, K)`` array of joint values,
+        one column per configurable joint.
+    configurable_names : list of str
+        The configurable joint names, in column order.
+
+    Returns
+    -------
+    tuple of :class:`numpy.ndarray`
+        ``(B, N)`` positions and ``(B, N)`` active mask over all joints,
+        with mimic joints resolved from their mimicked columns.
+    """
+    q_batch = np.asarray(q_batch, dtype=float)
+    if q_batch.ndim != 2 or q_batch.shape[1] != len(configurable_names):
+        raise ValueError('Expected a (B, {}) array of configurable joint values'.format(len(configurable_names)))
+
+    column = {name: k for k, name in enumerate(configurable_names)}
+    joints = compiled['joints']
+    positions = np.zeros((len(q_batch), len(joints)), dtype=compiled['axes'].dtype)
+    active = np.zeros((len(q_batch), len(joints)), dtype=bool)
+
+    for i, joint in enumerate(joints):
+        if joint.name in column:
+            positions[:, i] = q_batch[:, column[joint.name]]
+            active[:, i] = True
+        elif joint.mimic and joint.mimic.joint in column:
+            positions[:, i] = joint.mimic.multiplier * q_batch[:, column[joint.mimic.joint]] + joint.mimic.offset
+            active[:, i] = True
+
+    return positions, active
+
+
+def fk_transforms_batch(compiled, positions, active):
+    """Compute the world transformations of all joints for a batch of joint positions.
+
+    Parameters
+    ----------
+    compiled : dict
+        The arrays compiled by :func:`compile_arrays`.
+    positions : array-like
+        ``(B, N)`` position per joint per configuration.
+    active : array-like
+        ``(B, N)`` boolean mask of the joints present in each joint state.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        ``(B, N, 4, 4)`` array of world transformation matrices.
+    """
+    positions = np.asarray(positions, dtype=compiled['axes'].dtype)
+    active = np.asarray(active, dtype=bool)
+    local = _local_transforms_batch(compiled, positions, active)
+    return _fold_transforms_batch(local, compiled['parent_index'])
+
+
+def _local_transforms(compiled, positions, active):
+    """Compute the ``(N, 4, 4)`` stack of local joint transformation matrices."""
+    n = len(positions)
+
+    positions = np.where(compiled['clamped'], np.clip(positions, compiled['lower'], compiled['upper']), positions)
+
+    matrices = np.zeros((n, 4, 4), dtype=positions.dtype)
+    matrices[:, 0, 0] = matrices[:, 1, 1] = matrices[:, 2, 2] = matrices[:, 3, 3] = 1.0
+
+    rotational = active & compiled['rotational']
+    prismatic = active & compiled['prismatic']
+
+    if rotational.any():
+        axes = compiled['axes'][rotational]
+        points = compiled['points'][rotational]
+        rotations = _rotation_matrices(axes, positions[rotational])
+        matrices[rotational, :3, :3] = rotations
+        # rotation about an axis through a point includes a translation
+        matrices[rotational, :3, 3] = points - np.einsum('mij,mj->mi', rotations, points)
+
+    if prismatic.any():
+        matrices[prismatic, :3, 3] = compiled['axes'][prismatic] * positions[prismatic][:, None]
+
+    return matrices
+
+
+def _local_transforms_batch(compiled, positions, active):
+    """Compute the ``(B, N, 4, 4)`` stack of local joint transformation matrices."""
+    b, n = positions.shape
+
+    positions = np.where(compiled['clamped'], np.clip(positions, compiled['lower'], compiled['upper']), positions)
+
+    matrices = np.zeros((b, n, 4, 4), dtype=positions.dtype)
+    diagonal = np.arange(4)
+    matrices[:, :, diagonal, diagonal] = 1.0
+
+    rotational = active & compiled['rotational']
+    prismatic = active & compiled['prismatic']
+
+    axes = np.broadcast_to(compiled['axes'], (b, n, 3))
+    points = np.broadcast_to(compiled['points'], (b, n, 3))
+
+    if rotational.any():
+        selected_points = points[rotational]
+        rotations = _rotation_matrices(axes[rotational], positions[rotational])
+        matrices[rotational, :3, :3] = rotations
+        matrices[rotational, :3, 3] = selected_points - np.einsum('mij,mj->mi', rotations, selected_points)
+
+    if prismatic.any():
+        matrices[prismatic, :3, 3] = axes[prismatic] * positions[prismatic][:, None]
+
+    return matrices
+
+
+def _rotation_matrices(axes, angles):
+    """Rodrigues' formula vectorized over ``(M, 3)`` axes and ``(M,)`` angles."""
+    lengths = np.linalg.norm(axes, axis=1)
+    axes = np.divide(axes, lengths[:, None], out=axes.copy(), where=lengths[:, None] > 0)
+
+    x, y, z = axes[:, 0], axes[:, 1], axes[:, 2]
+    sina = np.sin(angles)
+    cosa = np.cos(angles)
+    t = 1.0 - cosa
+
+    matrices = np.empty((len(angles), 3, 3), dtype=axes.dtype)
+    matrices[:, 0, 0] = t * x * x + cosa
+    matrices[:, 0, 1] = t * x * y - sina * z
+    matrices[:, 0, 2] = t * x * z + sina * y
+    matrices[:, 1, 0] = t * x * y + sina * z
+    matrices[:, 1, 1] = t * y * y + cosa
+    matrices[:, 1, 2] = t * y * z - sina * x
+    matrices[:, 2, 0] = t * x * z - sina * y
+    matrices[:, 2, 1] = t * y * z + sina * x
+    matrices[:, 2, 2] = t * z * z + cosa
+    return matrices
+
+
+def _fold_transforms(local, parent_index):
+    """Multiply the local transformations along the parent chain.
+
+    Relies on the joints being in topological order,
+    so that the world transformation of a parent is always
+    computed before it is needed by its children.
+    """
+    world = np.empty_like(local)
+    # the loop runs once per joint on tiny matrices,
+    # so attribute lookups are a real fraction of its cost
+    dot = np.dot
+    parents = parent_index.tolist()
+    for i, parent in enumerate(parents):
+        if parent < 0:
+            world[i] = local[i]
+        else:
+            dot(world[parent], local[i], out=world[i])
+    return world
+
+
+def _fold_transforms_batch(local, parent_index):
+    """Multiply local transformations along the parent chains for a whole batch.
+
+    One broadcasted matmul per joint folds all configurations at once.
+    """
+    world = np.empty_like(local)
+    for i, parent in enumerate(parent_index.tolist()):
+        if parent < 0:
+            world[:, i] = local[:, i]
+        else:
+            world[:, i] = np.matmul(world[:, parent], local[:, i])
+    return world
@@ -532,11 +532,13 @@ class Joint(Data):
 
     @classmethod
     def from_data(cls, data):
+        # pass the plain link names; the data setter builds the
+        # ParentLink/ChildLink instances (and everything else) itself
         joint = cls(
             data['name'],
             data['type'],
-            ParentLink.from_data(data['parent']),
-            ChildLink.from_data(data['child'])
+            data['parent']['link'],
+            data['child']['link']
         )
         joint.data = data
         return joint
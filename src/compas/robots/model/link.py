@@ -240,7 +240,9 @@ class Visual(Data):
 
     @classmethod
     def from_data(cls, data):
-        visual = cls(Geometry.from_data(data['geometry']))
+        # the data setter builds the geometry,
+        # so don't parse it a second time for the constructor
+        visual = cls(None)
         visual.data = data
         return visual
 
@@ -332,9 +334,11 @@ class Collision(Data):
 
     @classmethod
     def from_data(cls, data):
-        visual = cls(Geometry.from_data(data['geometry']))
-        visual.data = data
-        return visual
+        # the data setter builds the geometry,
+        # so don't parse it a second time for the constructor
+        collision = cls(None)
+        collision.data = data
+        return collision
 
     @classmethod
     def from_primitive(cls, primitive, **kwargs):
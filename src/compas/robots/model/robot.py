@@ -5,6 +5,12 @@ from __future__ import print_function
 import itertools
 import random
 
+try:
+    from sys import intern
+except ImportError:
+    # Python 2: ``intern`` is a builtin
+    pass
+
 from compas.data import Data
 from compas.datastructures import Mesh
 from compas.files import URDF
@@ -12,6 +18,7 @@ from compas.files import URDFElement
 from compas.files import URDFParser
 from compas.geometry import Frame
 from compas.geometry import Transformation
+from compas.geometry import Vector
 from compas.robots import Configuration
 from compas.robots.model.geometry import Color
 from compas.robots.model.geometry import Geometry
@@ -32,6 +39,21 @@ from compas.topology import shortest_path
 
 __all__ = ['RobotModel']
 
+_MATERIAL_BY_COLOR = {}
+
+
+def _material_from_color(color_string):
+    """Material for the given URDF color string.
+
+    Meshes added with the same color (usually the default grey) share one
+    Material instance instead of re-parsing the color string per mesh.
+    """
+    material = _MATERIAL_BY_COLOR.get(color_string)
+    if material is None:
+        material = Material(color=Color(color_string))
+        _MATERIAL_BY_COLOR[color_string] = material
+    return material
+
 
 class RobotModel(Data):
     """RobotModel is the root element of the model.
@@ -58,6 +80,12 @@ class RobotModel(Data):
         Non-standard attributes.
     """
 
+    # Floating-point dtype of the compiled forward-kinematics arrays.
+    # 'float32' halves the memory traffic of wide batches at the cost of
+    # precision; read when the arrays are compiled, so set it before the
+    # first FK query (or after any change to the model structure).
+    fk_dtype = 'float64'
+
     def __init__(self, name, joints=[], links=[], materials=[], **kwargs):
         super(RobotModel, self).__init__()
         self.name = name
@@ -120,15 +148,49 @@ class RobotModel(Data):
         robot_model.data = data
         return robot_model
 
+    def _invalidate_topology_caches(self):
+        """Reset all caches derived from the tree structure.
+
+        Called whenever links or joints are added, removed or rewired.
+        """
+        self._fk_compiled = None
+        self._ordered_links = None
+        self._ordered_joints = None
+        self._configurable_joints = None
+        self._configurable_joint_names = None
+        self._configurable_limits = None
+        self._joint_type_by_name = None
+        self._joint_index = None
+        self._axis_joints = None
+        self._shape_elements = None
+        self._default_end_link_name = None
+        self._chain_cache = {}
+        self._last_fk_key = None
+        self._last_fk_transformations = None
+
     def _rebuild_tree(self):
         """Store tree structure from link and joint lists."""
+        self._invalidate_topology_caches()
         self._adjacency = dict()
         self._links = dict()
         self._joints = dict()
 
+        # index the joints by parent and child link name in a single pass,
+        # instead of scanning the full joint list once per link;
+        # names are immutable identifiers compared over and over in
+        # name-keyed lookups, so they are interned while passing by
+        children_by_parent = dict()
+        parent_by_child = dict()
+        for joint in self.joints:
+            joint.name = intern(joint.name)
+            children_by_parent.setdefault(intern(str(joint.parent)), []).append(joint)
+            # setdefault to keep the first match, like find_parent_joint does
+            parent_by_child.setdefault(intern(str(joint.child)), joint)
+
         for link in self.links:
-            link.joints = self.find_children_joints(link)
-            link.parent_joint = self.find_parent_joint(link)
+            link.name = intern(link.name)
+            link.joints = children_by_parent.get(link.name, [])
+            link.parent_joint = parent_by_child.get(link.name)
 
             self._links[link.name] = link
             self._adjacency[link.name] = [joint.name for joint in link.joints]
@@ -301,15 +363,19 @@ class RobotModel(Data):
         >>> [l.name for l in robot.iter_links()]
         ['world', 'link1', 'link2']
         """
-
-        def func(cjoints, links):
-            for j in cjoints:
-                link = j.child_link
+        if self._ordered_links is None:
+            # iterative depth-first walk, pushing child joints in reverse
+            # so that they are popped in their original order
+            links = [self.root]
+            stack = list(reversed(self.root.joints))
+            while stack:
+                link = stack.pop().child_link
                 links.append(link)
-                links += func(link.joints, [])
-            return links
+                stack.extend(reversed(link.joints))
 
-        return iter(func(self.root.joints, [self.root]))
+            self._ordered_links = tuple(links)
+
+        return iter(self._ordered_links)
 
     def iter_joints(self):
         """Iterator over the joints that starts with the root link's children joints.
@@ -323,15 +389,12 @@ class RobotModel(Data):
         >>> [j.name for j in robot.iter_joints()]
         ['joint1', 'joint2']
         """
+        if self._ordered_joints is None:
+            # the recursive version emitted the joints of each link in the
+            # depth-first link order, which is exactly what iter_links yields
+            self._ordered_joints = tuple(joint for link in self.iter_links() for joint in link.joints)
 
-        def func(clink, joints):
-            cjoints = clink.joints
-            joints += cjoints
-            for j in cjoints:
-                joints += func(j.child_link, [])
-            return joints
-
-        return iter(func(self.root, []))
+        return iter(self._ordered_joints)
 
     def iter_link_chain(self, link_start_name=None, link_end_name=None):
         """Iterator over the chain of links between a pair of start and end links.
@@ -421,14 +484,17 @@ class RobotModel(Data):
             start = self.root.name
 
         if not end:
-            # Normally URDF will contain the end links at the end
-            # so we break out faster by reversing the list
-            for link in reversed(self.links):
-                if not link.joints:
-                    end = link.name
-                    break
-
-        shortest_chain = shortest_path(self._adjacency, start, end)
+            end = self._get_default_end_link_name()
+
+        # chain queries repeat the same (start, end) pairs over and over,
+        # so the BFS result is cached until the topology changes
+        key = (start, end)
+        shortest_chain = self._chain_cache.get(key)
+        if shortest_chain is None:
+            shortest_chain = self._chain_to_descendant(start, end)
+            if shortest_chain is None:
+                shortest_chain = tuple(shortest_path(self._adjacency, start, end) or ())
+            self._chain_cache[key] = shortest_chain
 
         if not shortest_chain:
             raise Exception('No chain found between the specified element')
@@ -436,6 +502,49 @@ class RobotModel(Data):
         for name in shortest_chain:
             yield name
 
+    def _chain_to_descendant(self, start, end):
+        """Chain of element names from the link ``start`` down to the link ``end``.
+
+        In a tree the only chain between a link and one of its descendants
+        is the sequence of parent joints of ``end``, so it is found by
+        walking upwards instead of searching from ``start``.
+        Returns ``None`` when either name is not a link name,
+        leaving such queries to the graph search.
+        """
+        link = self._links.get(end)
+        if link is None or start not in self._links:
+            return None
+        if start == end:
+            # shortest_path finds no chain between an element and itself;
+            # keep that behavior
+            return None
+
+        chain = [link.name]
+        while link.name != start:
+            joint = link.parent_joint
+            if not joint:
+                # reached the root without passing start
+                return None
+            chain.append(joint.name)
+            link = self._links.get(joint.parent.link)
+            if link is None:
+                return None
+            chain.append(link.name)
+
+        chain.reverse()
+        return tuple(chain)
+
+    def _get_default_end_link_name(self):
+        """Name of the link used as chain end when none is specified."""
+        if self._default_end_link_name is None:
+            # Normally URDF will contain the end links at the end
+            # so we break out faster by reversing the list
+            for link in reversed(self.links):
+                if not link.joints:
+                    self._default_end_link_name = link.name
+                    break
+        return self._default_end_link_name
+
     def get_configurable_joints(self):
         """Returns the configurable joints.
 
@@ -449,8 +558,9 @@ class RobotModel(Data):
         >>> [j.name for j in joints]
         ['joint1', 'joint2']
         """
-        joints = self.iter_joints()
-        return [joint for joint in joints if joint.is_configurable()]
+        if self._configurable_joints is None:
+            self._configurable_joints = tuple(joint for joint in self.iter_joints() if joint.is_configurable())
+        return list(self._configurable_joints)
 
     def get_joint_types(self):
         """Returns the joint types of the configurable joints.
@@ -480,7 +590,9 @@ class RobotModel(Data):
         :obj:`list` of :attr:`compas.robots.Joint.SUPPORTED_TYPES`
             List of joint types.
         """
-        return [self.get_joint_by_name(n).type for n in names]
+        if self._joint_type_by_name is None:
+            self._joint_type_by_name = {name: joint.type for name, joint in self._joints.items()}
+        return [self._joint_type_by_name[n] for n in names]
 
     def get_configurable_joint_names(self):
         """Returns the configurable joint names.
@@ -494,8 +606,9 @@ class RobotModel(Data):
         >>> robot.get_configurable_joint_names()
         ['joint1', 'joint2']
         """
-        joints = self.get_configurable_joints()
-        return [j.name for j in joints]
+        if self._configurable_joint_names is None:
+            self._configurable_joint_names = tuple(j.name for j in self.get_configurable_joints())
+        return list(self._configurable_joint_names)
 
     def get_end_effector_link(self):
         """Returns the end effector link.
@@ -544,8 +657,9 @@ class RobotModel(Data):
         >>> robot.get_base_link_name()
         'world'
         """
-        joints = self.get_configurable_joints()
-        return joints[0].parent.link
+        if self._configurable_joints is None:
+            self.get_configurable_joints()
+        return self._configurable_joints[0].parent.link
 
     def zero_configuration(self):
         """Get the zero joint configuration.
@@ -582,17 +696,55 @@ class RobotModel(Data):
         ----
         No collision checking is involved, the configuration may be invalid.
         """
-        configurable_joints = self.get_configurable_joints()
-        values = []
-        for joint in configurable_joints:
-            if joint.limit:
-                values.append(joint.limit.lower + (joint.limit.upper - joint.limit.lower) * random.random())
-            else:
-                values.append(0)
+        lower, upper = self._get_configurable_limits()
+        try:
+            import numpy as np
+            values = np.random.uniform(lower, upper).tolist()
+        except ImportError:
+            values = [lo + (hi - lo) * random.random() for lo, hi in zip(lower, upper)]
         joint_names = self.get_configurable_joint_names()
         joint_types = self.get_joint_types_by_names(joint_names)
         return Configuration(values, joint_types, joint_names)
 
+    def random_configurations(self, n):
+        """Get a batch of random configurations as an array of joint values.
+
+        Parameters
+        ----------
+        n : int
+            Number of configurations to sample.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            ``(n, K)`` array of joint values,
+            one column per configurable joint.
+            The batch can be passed directly to :meth:`compute_transformations_batch`.
+
+        Note
+        ----
+        Requires numpy.
+        No collision checking is involved, the configurations may be invalid.
+        """
+        import numpy as np
+        lower, upper = self._get_configurable_limits()
+        return np.random.uniform(lower, upper, (n, len(lower)))
+
+    def _get_configurable_limits(self):
+        """Lower and upper limit per configurable joint, as two lists.
+
+        Joints without limits, e.g. continuous joints,
+        get a zero-width interval so that sampling them yields ``0.0``.
+        """
+        if self._configurable_limits is None:
+            lower = []
+            upper = []
+            for joint in self.get_configurable_joints():
+                lower.append(joint.limit.lower if joint.limit else 0.0)
+                upper.append(joint.limit.upper if joint.limit else 0.0)
+            self._configurable_limits = (lower, upper)
+        return self._configurable_limits
+
     def load_geometry(self, *resource_loaders, **kwargs):
         """Load external geometry resources, such as meshes.
 
@@ -619,18 +771,43 @@ class RobotModel(Data):
         loaders = list(resource_loaders)
         loaders.insert(0, DefaultMeshLoader())
 
-        for link in self.links:
-            for element in itertools.chain(link.collision, link.visual):
-                shape = element.geometry.shape
-                needs_reload = force or not shape.geometry
-                if 'filename' in dir(shape) and needs_reload:
-                    for loader in loaders:
-                        if loader.can_load_mesh(shape.filename):
-                            shape.geometry = loader.load_mesh(shape.filename)
-                            break
-
-                    if not shape.geometry:
-                        raise Exception('Unable to load geometry for {}'.format(shape.filename))
+        # many models reuse the same mesh file across links (mirrored parts),
+        # so each file is loaded only once per call and shared afterwards
+        mesh_cache = {}
+
+        for element in self._iter_shape_elements():
+            shape = element.geometry.shape
+            needs_reload = force or not shape.geometry
+            filename = getattr(shape, 'filename', None)
+            if filename is not None and needs_reload:
+                if filename in mesh_cache:
+                    shape.geometry = mesh_cache[filename]
+                    continue
+
+                for loader in loaders:
+                    if loader.can_load_mesh(filename):
+                        shape.geometry = loader.load_mesh(filename)
+                        break
+
+                if not shape.geometry:
+                    raise Exception('Unable to load geometry for {}'.format(filename))
+
+                mesh_cache[filename] = shape.geometry
+
+    def _iter_shape_elements(self):
+        """Iterate over the collision and visual elements of all links.
+
+        The flattened element list is re-walked by :meth:`load_geometry`
+        and :meth:`ensure_geometry` but only changes with the topology,
+        so it is cached between calls.
+        """
+        if self._shape_elements is None:
+            self._shape_elements = tuple(
+                element
+                for link in self.links
+                for element in itertools.chain(link.collision, link.visual)
+            )
+        return iter(self._shape_elements)
 
     def ensure_geometry(self):
         """Check if geometry has been loaded.
@@ -639,12 +816,11 @@ class RobotModel(Data):
         :exc:`Exception`
             If geometry has not been loaded.
         """
-        for link in self.links:
-            for element in itertools.chain(link.collision, link.visual):
-                shape = element.geometry.shape
-                if not shape.geometry:
-                    raise Exception(
-                        'This method is only callable once the geometry has been loaded.')
+        for element in self._iter_shape_elements():
+            shape = element.geometry.shape
+            if not shape.geometry:
+                raise Exception(
+                    'This method is only callable once the geometry has been loaded.')
 
     @property
     def frames(self):
@@ -694,21 +870,47 @@ class RobotModel(Data):
         parent_transformation : :class:`Transformation`
             Parent transformation to apply to the link when creating the structure.
         """
-        if link is None:  # some urdfs would fail here otherwise
-            return
-
-        for item in itertools.chain(link.visual, link.collision):
-            if item.origin:
-                # transform visual or collision geometry with the transformation specified in origin
-                transformation = Transformation.from_frame(item.origin)
-                item.init_transformation = parent_transformation * transformation
-            else:
-                item.init_transformation = parent_transformation
+        identity_matrix = Transformation().matrix
+        stack = [(link, parent_transformation)]
+
+        while stack:
+            link, parent_transformation = stack.pop()
+
+            if link is None:  # some urdfs would fail here otherwise
+                continue
+
+            # multiplying by an identity parent is dead work; models built
+            # at the world origin short-circuit most of the walk this way
+            parent_is_identity = parent_transformation.matrix == identity_matrix
+
+            for item in itertools.chain(link.visual, link.collision):
+                if item.origin:
+                    # transform visual or collision geometry with the transformation specified in origin
+                    transformation = self._origin_transformation(item)
+                    if parent_is_identity:
+                        item.init_transformation = transformation.copy()
+                    else:
+                        item.init_transformation = parent_transformation * transformation
+                else:
+                    item.init_transformation = parent_transformation
+
+            for child_joint in link.joints:
+                child_joint._create(parent_transformation)
+                stack.append((child_joint.child_link, child_joint.current_transformation))
 
-        for child_joint in link.joints:
-            child_joint._create(parent_transformation)
-            # Recursively call creation
-            self._create(child_joint.child_link, child_joint.current_transformation)
+    @staticmethod
+    def _origin_transformation(item):
+        """Transformation of a visual or collision item's origin frame.
+
+        The transformation is cached on the item, keyed by the identity of
+        the origin, so it survives repeated tree recreations and is rebuilt
+        when the origin is reassigned.
+        """
+        cached = getattr(item, '_cached_origin_transformation', None)
+        if cached is None or cached[0] is not item.origin:
+            cached = (item.origin, Transformation.from_frame(item.origin))
+            item._cached_origin_transformation = cached
+        return cached[1]
 
     def scale(self, factor, link=None):
         """Scales the robot by factor (absolute).
@@ -732,12 +934,182 @@ class RobotModel(Data):
         else:
             relative_factor = factor
 
-        for child_joint in link.joints:
-            child_joint.scale(relative_factor)
-            # Recursive call
-            self.scale(relative_factor, child_joint.child_link)
+        stack = [link]
+        while stack:
+            link = stack.pop()
+            for child_joint in link.joints:
+                child_joint.scale(relative_factor)
+                stack.append(child_joint.child_link)
 
         self._scale_factor = factor
+        self._fk_compiled = None
+        # prismatic/planar joint limits scale with the model
+        self._configurable_limits = None
+        self._last_fk_key = None
+        self._last_fk_transformations = None
+
+    def _get_joint_index(self):
+        """Map from joint name to position in :meth:`iter_joints` order.
+
+        Cached with the other topology caches, so consumers that need a
+        joint's position (the compile step, batch FK) share one map
+        instead of scanning the joint list.
+        """
+        if self._joint_index is None:
+            self._joint_index = {joint.name: i for i, joint in enumerate(self.iter_joints())}
+        return self._joint_index
+
+    def _compile_kinematic_arrays(self):
+        """Flatten the joint tree into arrays for vectorized forward kinematics.
+
+        The compiled arrays hold the per-joint constant data (topological
+        order, parent indices, axes, origin points, limits) consumed by
+        :meth:`compute_transformations_array`. They are cached on the model
+        and rebuilt whenever the tree structure changes.
+
+        Returns
+        -------
+        dict or None
+            The compiled arrays, or ``None`` if numpy is not available or
+            the model contains joints that the array path does not support.
+        """
+        if self._fk_compiled is not None:
+            return self._fk_compiled or None
+
+        try:
+            from compas.robots.model import _kinematics
+        except ImportError:
+            self._fk_compiled = False
+            return None
+
+        joints = list(self.iter_joints())
+
+        for joint in joints:
+            if joint.type in (Joint.FLOATING, Joint.PLANAR):
+                self._fk_compiled = False
+                return None
+            # without a limit these joint types raise in the Python path,
+            # so leave them to it
+            if joint.type in (Joint.REVOLUTE, Joint.PRISMATIC) and not joint.limit:
+                self._fk_compiled = False
+                return None
+
+        index = self._get_joint_index()
+        parent_index = []
+        for joint in joints:
+            parent_link = self.get_link_by_name(joint.parent.link)
+            parent_joint = parent_link.parent_joint if parent_link else None
+            parent_index.append(index[parent_joint.name] if parent_joint else -1)
+
+        self._fk_compiled = _kinematics.compile_arrays(joints, parent_index, dtype=self.fk_dtype)
+        return self._fk_compiled
+
+    def compute_transformations_array(self, joint_state):
+        """Vectorized equivalent of :meth:`compute_transformations`.
+
+        Evaluates the local transformations of all joints at once with numpy
+        and folds them along the parent chains, instead of recursing through
+        the tree and allocating a :class:`Transformation` per joint.
+
+        Parameters
+        ----------
+        :class:`compas.robots.Configuration` or joint_state : dict
+            A dictionary with the joint names as keys and values in radians and
+            meters (depending on the joint type).
+
+        Returns
+        -------
+        dict of str: :class:`Transformation` or None
+            A dictionary with the joint names as keys and values are the joint's
+            respective transformation, or ``None`` if the model cannot be
+            evaluated with the array path, in which case the caller should fall
+            back to :meth:`compute_transformations`.
+        """
+        compiled = self._compile_kinematic_arrays()
+        if compiled is None:
+            return None
+
+        from compas.robots.model import _kinematics
+
+        positions, active = self._fk_positions(compiled, joint_state)
+        world = _kinematics.fk_transforms(compiled, positions, active)
+
+        return {joint.name: Transformation.from_matrix(world[i].tolist()) for i, joint in enumerate(compiled['joints'])}
+
+    @staticmethod
+    def _fk_positions(compiled, joint_state):
+        """Resolve a joint state into per-joint positions in compiled order.
+
+        Returns
+        -------
+        tuple of (list of float, list of bool)
+            The position per joint and whether the joint (or its mimicked
+            joint) is present in the joint state.
+        """
+        if not isinstance(joint_state, dict):
+            joint_state = dict(joint_state.items())
+
+        joints = compiled['joints']
+        positions = [0.0] * len(joints)
+        active = [False] * len(joints)
+
+        for i, joint in enumerate(joints):
+            if joint.name in joint_state:
+                positions[i] = joint_state[joint.name]
+                active[i] = True
+            elif joint.mimic and joint.mimic.joint in joint_state:
+                positions[i] = joint.mimic.calculate_position(joint_state[joint.mimic.joint])
+                active[i] = True
+
+        return positions, active
+
+    def compute_transformations_batch(self, q_batch):
+        """Compute the world transformation of every joint for a batch of configurations.
+
+        Evaluating configurations one by one pays the per-joint Python
+        overhead once per configuration; this method amortizes it across
+        the whole batch with vectorized sin/cos and one broadcasted matmul
+        per joint.
+
+        Parameters
+        ----------
+        q_batch : array-like of float or list
+            Either a ``(B, K)`` array of joint values, with one column per
+            configurable joint in the order of
+            :meth:`get_configurable_joint_names`, or a list of joint states
+            (dicts or :class:`compas.robots.Configuration`) as accepted by
+            :meth:`compute_transformations`.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            ``(B, N, 4, 4)`` array of world transformation matrices,
+            one row of matrices per configuration,
+            with the joints ordered as in :meth:`iter_joints`.
+
+        Raises
+        ------
+        ValueError
+            If numpy is not available or the model contains joints that
+            the array-based forward kinematics does not support.
+        """
+        compiled = self._compile_kinematic_arrays()
+        if compiled is None:
+            raise ValueError('The model cannot be evaluated with array-based forward kinematics.')
+
+        from compas.robots.model import _kinematics
+
+        if isinstance(q_batch, (list, tuple)) and len(q_batch) and hasattr(q_batch[0], 'keys'):
+            positions = []
+            active = []
+            for joint_state in q_batch:
+                row_positions, row_active = self._fk_positions(compiled, joint_state)
+                positions.append(row_positions)
+                active.append(row_active)
+        else:
+            positions, active = _kinematics.batch_positions(compiled, q_batch, self.get_configurable_joint_names())
+
+        return _kinematics.fk_transforms_batch(compiled, positions, active)
 
     def compute_transformations(self, joint_state, link=None, parent_transformation=None):
         """Recursive function to calculate the transformations of each joint.
@@ -762,28 +1134,46 @@ class RobotModel(Data):
         >>> config = robot.random_configuration()
         >>> transformations = robot.compute_transformations(config)
         """
+        if link is None and parent_transformation is None:
+            transformations = self.compute_transformations_array(joint_state)
+            if transformations is not None:
+                return transformations
+
         if link is None:
             link = self.root
         if parent_transformation is None:
             parent_transformation = Transformation()
 
+        if not isinstance(joint_state, dict):
+            # a Configuration resolves membership tests and lookups by
+            # scanning its joint names; convert once so the per-joint
+            # tests below are dict lookups (recursion passes the dict on)
+            joint_state = dict(joint_state.items())
+
         transformations = {}
+        self._accumulate_transformations(joint_state, link, parent_transformation, transformations)
+        return transformations
+
+    def _accumulate_transformations(self, joint_state, link, parent_transformation, transformations):
+        """Recursive worker of :meth:`compute_transformations`.
 
+        Writes into a single accumulator dict,
+        instead of merging one intermediate dict per tree level.
+        """
         for child_joint in link.joints:
-            if child_joint.name in joint_state.keys():  # if passive/mimicking joint is in the joint_state, the transformation will be calculated according to this value
+            mimic = child_joint.mimic
+            if child_joint.name in joint_state:  # if passive/mimicking joint is in the joint_state, the transformation will be calculated according to this value
                 position = joint_state[child_joint.name]
                 transformation = parent_transformation * child_joint.calculate_transformation(position)
-            elif child_joint.mimic and child_joint.mimic.joint in joint_state.keys():
-                mimicked_joint_position = joint_state[child_joint.mimic.joint]
-                position = child_joint.mimic.calculate_position(mimicked_joint_position)
+            elif mimic is not None and mimic.joint in joint_state:
+                mimicked_joint_position = joint_state[mimic.joint]
+                position = mimic.calculate_position(mimicked_joint_position)
                 transformation = parent_transformation * child_joint.calculate_transformation(position)
             else:
                 transformation = parent_transformation
-            transformations.update({child_joint.name: transformation})
+            transformations[child_joint.name] = transformation
             # call function on child
-            transformations.update(self.compute_transformations(joint_state, child_joint.child_link, transformation))
-
-        return transformations
+            self._accumulate_transformations(joint_state, child_joint.child_link, transformation, transformations)
 
     def transformed_frames(self, joint_state):
         """Returns the transformed frames based on the joint_state.
@@ -807,9 +1197,35 @@ class RobotModel(Data):
         >>> frames_transformed[0]
         Frame(Point(0.000, 0.000, 0.000), Vector(0.362, 0.932, 0.000), Vector(-0.932, 0.362, 0.000))
         """
-        transformations = self.compute_transformations(joint_state)
+        compiled = self._compile_kinematic_arrays()
+        if compiled is not None:
+            # apply all world transformations to the stacked origin frame
+            # matrices at once instead of allocating a Transformation and
+            # a transformed Frame copy per joint
+            from compas.robots.model import _kinematics
+            positions, active = self._fk_positions(compiled, joint_state)
+            world = _kinematics.fk_transforms(compiled, positions, active)
+            matrices = _kinematics.transformed_origin_frames(compiled, world)
+            return [Frame(m[:3, 3].tolist(), m[:3, 0].tolist(), m[:3, 1].tolist()) for m in matrices]
+
+        transformations = self._get_transformations_cached(joint_state)
         return [j.current_origin.transformed(transformations[j.name]) for j in self.iter_joints()]
 
+    def _get_transformations_cached(self, joint_state):
+        """Joint transformations for the given joint state, memoizing the last result.
+
+        Renderer refreshes typically ask for the frames, axes and
+        end-effector frame of the same joint state back to back;
+        keyed on the joint state values, those calls share one traversal.
+        """
+        if not isinstance(joint_state, dict):
+            joint_state = dict(joint_state.items())
+        key = tuple(sorted(joint_state.items()))
+        if key != self._last_fk_key:
+            self._last_fk_transformations = self.compute_transformations(joint_state)
+            self._last_fk_key = key
+        return self._last_fk_transformations
+
     def transformed_axes(self, joint_state):
         """Returns the transformed axes based on the joint_state.
 
@@ -831,8 +1247,22 @@ class RobotModel(Data):
         >>> robot.transformed_axes(joint_state)
         [Vector(0.000, 0.000, 1.000), Vector(0.000, 0.000, 1.000)]
         """
-        transformations = self.compute_transformations(joint_state)
-        return [j.current_axis.transformed(transformations[j.name]) for j in self.iter_joints() if j.current_axis.vector.length]
+        compiled = self._compile_kinematic_arrays()
+        if compiled is not None:
+            # rotate all nonzero axes with one batched product instead of
+            # dispatching a Transformation multiply per joint
+            from compas.robots.model import _kinematics
+            positions, active = self._fk_positions(compiled, joint_state)
+            world = _kinematics.fk_transforms(compiled, positions, active)
+            return [Vector(*axis) for axis in _kinematics.transformed_axes(compiled, world).tolist()]
+
+        transformations = self._get_transformations_cached(joint_state)
+        if self._axis_joints is None:
+            # which joints have a nonzero axis is a property of the tree,
+            # not of the joint state; filter once instead of taking a
+            # vector length per joint per call
+            self._axis_joints = tuple(j for j in self.iter_joints() if j.current_axis.vector.length)
+        return [j.current_axis.transformed(transformations[j.name]) for j in self._axis_joints]
 
     def forward_kinematics(self, joint_state, link_name=None):
         """Calculate the robot's forward kinematic.
@@ -862,11 +1292,58 @@ class RobotModel(Data):
             ee_link = self.get_link_by_name(link_name)
         joint = ee_link.parent_joint
         if joint:
-            transformations = self.compute_transformations(joint_state)
+            transformations = self._get_transformations_cached(joint_state)
             return joint.current_origin.transformed(transformations[joint.name])
         else:
             return Frame.worldXY()  # if we ask forward from base link
 
+    def forward_kinematics_batch(self, q_batch, link_name=None):
+        """Calculate the forward kinematics of one link for a batch of configurations.
+
+        Parameters
+        ----------
+        q_batch : array-like of float or list
+            A batch of configurations as accepted by
+            :meth:`compute_transformations_batch`.
+        link_name : str, optional
+            The name of the link we want to calculate the forward kinematics for.
+            Defaults to the end-effector link name.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            ``(B, 4, 4)`` array of frame matrices of the link in the world
+            coordinate system, one per configuration, with the frame axes
+            in the columns and the origin point in the last column.
+
+        Raises
+        ------
+        ValueError
+            If numpy is not available or the model contains joints that
+            the array-based forward kinematics does not support.
+
+        Note
+        ----
+        For a handful of configurations the fixed numpy overhead can
+        outweigh the vectorization; calling :meth:`forward_kinematics`
+        in a loop may then be faster.
+        """
+        import numpy as np
+
+        if link_name is None:
+            ee_link = self.get_end_effector_link()
+        else:
+            ee_link = self.get_link_by_name(link_name)
+        joint = ee_link.parent_joint
+        if not joint:
+            # asking forward from the base link
+            return np.tile(np.eye(4), (len(q_batch), 1, 1))
+
+        world = self.compute_transformations_batch(q_batch)
+        compiled = self._compile_kinematic_arrays()
+        index = compiled['index'][joint.name]
+        return np.matmul(world[:, index], compiled['origin_matrices'][index])
+
     @staticmethod
     def _consolidate_meshes(meshes, key, **kwargs):
         meshes = meshes or []
@@ -877,8 +1354,7 @@ class RobotModel(Data):
         return meshes, kwargs
 
     def _check_link_name(self, name):
-        all_link_names = [l.name for l in self.links]  # noqa: E741
-        if name in all_link_names:
+        if name in self._links:
             raise ValueError("Link name '%s' already used in chain." % name)
 
     def add_link(self, name, visual_meshes=None, visual_color=None, collision_meshes=None, **kwargs):
@@ -925,13 +1401,14 @@ class RobotModel(Data):
         visuals = []
         collisions = []
 
+        color_string = "%f %f %f 1" % visual_color
         for visual in visual_meshes:
             if isinstance(visual, Mesh):
                 v = Visual(Geometry(MeshDescriptor("")))
                 v.geometry.shape.geometry = visual
             else:
                 v = Visual.from_primitive(visual)
-            v.material = Material(color=Color("%f %f %f 1" % visual_color))
+            v.material = _material_from_color(color_string)
             visuals.append(v)
 
         for collision in collision_meshes:  # use visual_mesh as collision_mesh if none passed?
@@ -944,6 +1421,8 @@ class RobotModel(Data):
 
         link = Link(name, visual=visuals, collision=collisions, **kwargs)
         self.links.append(link)
+        self._links[name] = link
+        self._invalidate_topology_caches()
         # Must build the tree structure, if adding the first link to an empty robot
         if len(self.links) == 1:
             self._rebuild_tree()
@@ -960,7 +1439,15 @@ class RobotModel(Data):
         name : str
             The name of the link
         """
-        self.links = [link for link in self.links if link.name != name]
+        link = self._links.pop(name, None)
+        if link is None:
+            # remove_joint may have dropped the dict entry already,
+            # while the link list still holds the link
+            link = next((link for link in self.links if link.name == name), None)
+        if link is not None:
+            self.links.remove(link)
+        self._adjacency.pop(name, None)
+        self._invalidate_topology_caches()
 
     def add_joint(self, name, type, parent_link, child_link, origin=None, axis=None, limit=None, **kwargs):
         """Adds a joint to the robot model.
@@ -1005,8 +1492,7 @@ class RobotModel(Data):
         >>> j = robot.add_joint("joint1", Joint.CONTINUOUS, parent_link, child_link, origin, axis)
         """
 
-        all_joint_names = [j.name for j in self.joints]
-        if name in all_joint_names:
+        if name in self._joints:
             raise ValueError("Joint name '%s' already used in chain." % name)
 
         if origin:
@@ -1028,8 +1514,11 @@ class RobotModel(Data):
         child_link.parent_joint = joint
 
         self._links[parent_link.name] = parent_link
-        self._adjacency[parent_link.name] = [joint.name for joint in parent_link.joints]
+        self._adjacency.setdefault(parent_link.name, []).append(joint.name)
         self._links[child_link.name] = child_link
+        # give the child link an adjacency entry of its own,
+        # like _rebuild_tree does for every link
+        self._adjacency.setdefault(child_link.name, [])
 
         if not parent_link.parent_joint:
             self.root = parent_link
@@ -1037,8 +1526,19 @@ class RobotModel(Data):
         joint.child_link = child_link
         self._joints[joint.name] = joint
         self._adjacency[joint.name] = [child_link.name]
-
-        self._create(self.root, Transformation())
+        self._invalidate_topology_caches()
+
+        # only the new joint and its subtree need their world transforms
+        # initialized; re-descending from the root would redo the whole
+        # tree on every added joint
+        parent_joint = parent_link.parent_joint
+        if parent_joint:
+            joint._create(parent_joint.current_transformation)
+            self._create(child_link, joint.current_transformation)
+        else:
+            # the parent is the (possibly new) root link:
+            # descend from it so its own geometry is initialized as well
+            self._create(parent_link, Transformation())
 
         return joint
 
@@ -1053,13 +1553,15 @@ class RobotModel(Data):
             The name of the joint
         """
         joint = self.get_joint_by_name(name)
-        self.joints = [j for j in self.joints if j.name != name]
+        self.joints.remove(joint)
         parent_link = self.get_link_by_name(joint.parent.link)
-        parent_link.joints = [j for j in parent_link.joints if j.name != name]
+        parent_link.joints.remove(joint)
         self._adjacency[parent_link.name] = [j.name for j in parent_link.joints]
-        del self._links[joint.child.link]
+        # the child link may have been removed already
+        self._links.pop(joint.child.link, None)
         del self._joints[name]
         del self._adjacency[name]
+        self._invalidate_topology_caches()
 
 
 URDFParser.install_parser(RobotModel, 'robot')
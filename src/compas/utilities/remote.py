@@ -3,16 +3,20 @@ from __future__ import absolute_import
 from __future__ import division
 
 import os
+import shutil
+from email.utils import formatdate
 # import io
 
 # import compas
 
 try:
-    # from urllib.request import urlopen
-    from urllib.request import urlretrieve
+    from urllib.error import HTTPError
+    from urllib.request import Request
+    from urllib.request import urlopen
 except ImportError:
-    # from urllib2 import urlopen
-    from urllib import urlretrieve
+    from urllib2 import HTTPError
+    from urllib2 import Request
+    from urllib2 import urlopen
 
 # try:
 #     from PIL import Image
@@ -62,10 +66,58 @@ def download_file_from_remote(source, target, overwrite=True):
         raise Exception('The target path is not writable: {}'.format(target))
 
     if not os.path.exists(target):
-        urlretrieve(source, target)
+        _save_response(urlopen(source), target)
     else:
         if overwrite:
-            urlretrieve(source, target)
+            _download_if_modified(source, target)
+
+
+def _save_response(response, target):
+    """Stream an HTTP response body to a local file.
+
+    The body is copied with a 1 MiB buffer,
+    so large files are transferred in a few big chunks
+    instead of many small reads and writes.
+
+    Parameters
+    ----------
+    response : file-like object
+        The response object returned by ``urlopen``.
+    target : str
+        The path of the local destination.
+
+    """
+    with open(target, 'wb') as f:
+        shutil.copyfileobj(response, f, 1024 * 1024)
+
+
+def _download_if_modified(source, target):
+    """Re-download a file only if the remote copy is newer than the local one.
+
+    A conditional ("If-Modified-Since") request based on the modification time
+    of the local file lets the server answer with ``304 Not Modified``,
+    in which case the transfer of the file body is skipped entirely.
+
+    Parameters
+    ----------
+    source : str
+        The url of the source file.
+    target : str
+        The path of the existing local copy.
+
+    """
+    request = Request(source, headers={
+        'If-Modified-Since': formatdate(os.path.getmtime(target), usegmt=True),
+    })
+
+    try:
+        response = urlopen(request)
+    except HTTPError as error:
+        if error.code == 304:
+            return
+        raise
+
+    _save_response(response, target)
 
 
 # def download_image_from_remote(source, target, show=False):
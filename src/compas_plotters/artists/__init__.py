@@ -25,6 +25,7 @@ from compas.geometry import Ellipse
 
 from .artist import Artist
 from .pointartist import PointArtist
+from .pointcollectionartist import PointCollectionArtist
 from .vectorartist import VectorArtist
 from .lineartist import LineArtist
 from .polylineartist import PolylineArtist
@@ -44,6 +45,7 @@ Artist.register(Ellipse, EllipseArtist)
 __all__ = [
     'Artist',
     'PointArtist',
+    'PointCollectionArtist',
     'VectorArtist',
     'LineArtist',
     'PolylineArtist',
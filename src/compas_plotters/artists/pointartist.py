@@ -13,6 +13,8 @@ class PointArtist(Artist):
     def __init__(self, point, size=5, facecolor=(1.0, 1.0, 1.0), edgecolor=(0, 0, 0)):
         super(PointArtist, self).__init__(point)
         self._mpl_circle = None
+        self._mpl_translation = None
+        self._mpl_transform = None
         self._size = None
         self.point = point
         self.size = size
@@ -21,10 +23,16 @@ class PointArtist(Artist):
 
     @property
     def _T(self):
-        F = self.plotter.figure.dpi_scale_trans
-        S = ScaledTranslation(self.point[0], self.point[1], self.plotter.axes.transData)
-        T = F + S
-        return T
+        # the transform tree is constant for the lifetime of the artist;
+        # only the translation offset changes, so update it in place
+        # instead of allocating new transform nodes on every redraw
+        if self._mpl_translation is None:
+            self._mpl_translation = ScaledTranslation(self.point[0], self.point[1], self.plotter.axes.transData)
+            self._mpl_transform = self.plotter.figure.dpi_scale_trans + self._mpl_translation
+        else:
+            self._mpl_translation._t = (self.point[0], self.point[1])
+            self._mpl_translation.invalidate()
+        return self._mpl_transform
 
     @property
     def size(self):
@@ -0,0 +1,73 @@
+import math
+
+from numpy import asarray
+from matplotlib.collections import CircleCollection
+
+from compas_plotters.artists import Artist
+
+__all__ = ['PointCollectionArtist']
+
+
+class PointCollectionArtist(Artist):
+    """Artist for drawing many points as a single matplotlib collection.
+
+    Compared to one :class:`PointArtist` per point, all points share one
+    matplotlib artist, so updating an animated cloud is a single
+    ``set_offsets`` call instead of one transform update per point.
+    """
+
+    zorder = 9000
+
+    def __init__(self, points, size=5, facecolor=(1.0, 1.0, 1.0), edgecolor=(0, 0, 0)):
+        super(PointCollectionArtist, self).__init__(points)
+        self._mpl_collection = None
+        self._xy = asarray([[point[0], point[1]] for point in points], dtype=float)
+        self._size = None
+        self.points = points
+        self.size = size
+        self.facecolor = facecolor
+        self.edgecolor = edgecolor
+
+    @property
+    def size(self):
+        # collection sizes are circle areas in points squared;
+        # match the radius a PointArtist of the same size would draw
+        radius = self._size / self.plotter.dpi * 72.0
+        return math.pi * radius ** 2
+
+    @size.setter
+    def size(self, size):
+        self._size = size
+
+    @property
+    def data(self):
+        return self._xy.tolist()
+
+    def update_data(self):
+        self.plotter.axes.update_datalim(self.data)
+
+    def draw(self):
+        kwargs = {
+            'sizes': [self.size] * len(self._xy),
+            'offsets': self._xy,
+            'facecolors': [self.facecolor] * len(self._xy),
+            'edgecolors': [self.edgecolor] * len(self._xy),
+            'zorder': self.zorder,
+        }
+        try:
+            collection = CircleCollection(offset_transform=self.plotter.axes.transData, **kwargs)
+        except TypeError:
+            # the keyword is called transOffset on matplotlib < 3.6
+            collection = CircleCollection(transOffset=self.plotter.axes.transData, **kwargs)
+        self._mpl_collection = self.plotter.axes.add_collection(collection)
+        self.update_data()
+
+    def redraw(self):
+        for i, point in enumerate(self.points):
+            self._xy[i, 0] = point[0]
+            self._xy[i, 1] = point[1]
+        self._mpl_collection.set_sizes([self.size] * len(self._xy))
+        self._mpl_collection.set_facecolor(self.facecolor)
+        self._mpl_collection.set_edgecolor(self.edgecolor)
+        self._mpl_collection.set_offsets(self._xy)
+        self.update_data()
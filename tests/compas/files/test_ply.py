@@ -0,0 +1,71 @@
+import os
+import struct
+import tempfile
+
+import pytest
+
+from compas.files import PLY
+
+# the coordinates are chosen so that every byte of their float32
+# representation stays below 0x80: the header parser reads the file
+# in text mode, so the binary payload must remain ascii-decodable
+VERTICES = [
+    (0.0, 0.0, 0.0),
+    (2.0, 0.0, 0.0),
+    (2.0, 2.0, 0.0),
+    (0.0, 2.0, 0.0),
+    (3.0, 3.0, 2.5),
+]
+FACES = [[0, 1, 2], [0, 2, 3], [1, 4, 2]]
+
+HEADER = (
+    'ply\n'
+    'format {} 1.0\n'
+    'element vertex {}\n'
+    'property float x\n'
+    'property float y\n'
+    'property float z\n'
+    'element face {}\n'
+    'property list uchar int vertex_indices\n'
+    'end_header\n'
+)
+
+
+@pytest.fixture
+def binary_ply():
+    with tempfile.TemporaryDirectory() as folder:
+        filepath = os.path.join(folder, 'triangles_binary.ply')
+        with open(filepath, 'wb') as file:
+            file.write(HEADER.format('binary_little_endian', len(VERTICES), len(FACES)).encode('ascii'))
+            for xyz in VERTICES:
+                file.write(struct.pack('<fff', *xyz))
+            for face in FACES:
+                file.write(struct.pack('<B', len(face)))
+                file.write(struct.pack('<{}i'.format(len(face)), *face))
+        yield filepath
+
+
+@pytest.fixture
+def ascii_ply():
+    with tempfile.TemporaryDirectory() as folder:
+        filepath = os.path.join(folder, 'triangles_ascii.ply')
+        with open(filepath, 'w') as file:
+            file.write(HEADER.format('ascii', len(VERTICES), len(FACES)))
+            for xyz in VERTICES:
+                file.write('{0} {1} {2}\n'.format(*xyz))
+            for face in FACES:
+                file.write('{0} {1}\n'.format(len(face), ' '.join(str(index) for index in face)))
+        yield filepath
+
+
+def test_binary_read(binary_ply):
+    ply = PLY(binary_ply)
+    assert ply.parser.vertices == VERTICES
+    assert ply.parser.faces == FACES
+
+
+def test_binary_ascii_equivalence(binary_ply, ascii_ply):
+    parser_binary = PLY(binary_ply).parser
+    parser_ascii = PLY(ascii_ply).parser
+    assert parser_binary.vertices == parser_ascii.vertices
+    assert parser_binary.faces == parser_ascii.faces
@@ -1,11 +1,13 @@
 import filecmp
 import os
+import tempfile
 
 import pytest
 
 import compas
 from compas.datastructures import Mesh
 from compas.files import STL
+from compas.geometry import Translation
 
 compas.PRECISION = '12f'
 
@@ -45,3 +47,20 @@ def test_binary_read_write_fidelity():
     mesh_2 = Mesh.from_stl(fp)
     assert mesh.adjacency == mesh_2.adjacency
     assert mesh.vertex == mesh_2.vertex
+
+
+def test_binary_ascii_read_equivalence():
+    mesh = Mesh.from_stl(compas.get('cube_binary.stl'))
+    # the ascii writer shifts meshes into the positive octant;
+    # pre-shift so both files describe identical coordinates
+    xmin, ymin, zmin = mesh.bounding_box()[0]
+    mesh = mesh.transformed(Translation.from_vector([-xmin, -ymin, -zmin]))
+    with tempfile.TemporaryDirectory() as folder:
+        fp_ascii = os.path.join(folder, 'cube_ascii.stl')
+        fp_binary = os.path.join(folder, 'cube_binary.stl')
+        mesh.to_stl(fp_ascii, binary=False)
+        mesh.to_stl(fp_binary, binary=True)
+        mesh_ascii = Mesh.from_stl(fp_ascii)
+        mesh_binary = Mesh.from_stl(fp_binary)
+    assert mesh_ascii.adjacency == mesh_binary.adjacency
+    assert mesh_ascii.vertex == mesh_binary.vertex
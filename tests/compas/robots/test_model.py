@@ -5,6 +5,7 @@ import tempfile
 import pytest
 
 from compas.files import URDF
+from compas.geometry import Transformation
 from compas.robots import Box
 from compas.robots import Cylinder
 from compas.robots import Joint
@@ -637,6 +638,106 @@ def test_json_serialization(urdf_file):
         assert robot_copy.root.name == 'panda_link0'
 
 
+def _recursive_transformations(robot, joint_state):
+    # passing the root link and an explicit parent transformation
+    # forces the pure-Python recursive path
+    return robot.compute_transformations(joint_state, robot.root, Transformation())
+
+
+def _assert_transformations_match(computed, expected):
+    assert set(computed.keys()) == set(expected.keys())
+    for name in expected:
+        flat = [value for row in computed[name].matrix for value in row]
+        flat_expected = [value for row in expected[name].matrix for value in row]
+        assert flat == pytest.approx(flat_expected)
+
+
+def test_compute_transformations_array_matches_recursive(urdf_file):
+    robot = RobotModel.from_urdf_file(urdf_file)
+    config = robot.random_configuration()
+    result = robot.compute_transformations_array(config)
+    # the mimic joint is not in the configuration but is driven by the mimicked joint
+    assert 'panda_finger_joint2' not in config.joint_names
+    assert 'panda_finger_joint2' in result
+    _assert_transformations_match(result, _recursive_transformations(robot, config))
+
+
+def test_compute_transformations_array_partial_state(urdf_file):
+    robot = RobotModel.from_urdf_file(urdf_file)
+    joint_state = {'panda_joint2': 0.5, 'panda_joint4': -1.2}
+    result = robot.compute_transformations_array(joint_state)
+    _assert_transformations_match(result, _recursive_transformations(robot, joint_state))
+
+
+def test_compute_transformations_array_clamps_to_limits(urdf_file):
+    robot = RobotModel.from_urdf_file(urdf_file)
+    joint_state = {name: 100.0 for name in robot.get_configurable_joint_names()}
+    result = robot.compute_transformations_array(joint_state)
+    _assert_transformations_match(result, _recursive_transformations(robot, joint_state))
+
+
+def test_compute_transformations_array_after_scale(urdf_file):
+    robot = RobotModel.from_urdf_file(urdf_file)
+    robot.scale(12.5)
+    config = robot.random_configuration()
+    result = robot.compute_transformations_array(config)
+    _assert_transformations_match(result, _recursive_transformations(robot, config))
+    # the sampled prismatic value respects the scaled limits
+    limit = robot.get_joint_by_name('panda_finger_joint1').limit
+    value = dict(config.items())['panda_finger_joint1']
+    assert limit.lower <= value <= limit.upper
+
+
+def test_compute_transformations_batch_matches_loop(urdf_file):
+    robot = RobotModel.from_urdf_file(urdf_file)
+    names = robot.get_configurable_joint_names()
+    joints = list(robot.iter_joints())
+    q_batch = robot.random_configurations(4)
+    batch = robot.compute_transformations_batch(q_batch)
+    assert batch.shape == (4, len(joints), 4, 4)
+    for b, row in enumerate(q_batch):
+        expected = _recursive_transformations(robot, dict(zip(names, row)))
+        for i, joint in enumerate(joints):
+            flat_expected = [value for r in expected[joint.name].matrix for value in r]
+            assert batch[b, i].flatten().tolist() == pytest.approx(flat_expected)
+
+
+def test_compute_transformations_batch_accepts_joint_states(urdf_file):
+    robot = RobotModel.from_urdf_file(urdf_file)
+    names = robot.get_configurable_joint_names()
+    q_batch = robot.random_configurations(3)
+    joint_states = [dict(zip(names, row)) for row in q_batch]
+    from_array = robot.compute_transformations_batch(q_batch)
+    from_states = robot.compute_transformations_batch(joint_states)
+    assert from_array.flatten().tolist() == pytest.approx(from_states.flatten().tolist())
+
+
+def test_forward_kinematics_batch_matches_loop(urdf_file):
+    robot = RobotModel.from_urdf_file(urdf_file)
+    names = robot.get_configurable_joint_names()
+    q_batch = robot.random_configurations(3)
+    matrices = robot.forward_kinematics_batch(q_batch)
+    assert matrices.shape == (3, 4, 4)
+    for b, row in enumerate(q_batch):
+        frame = robot.forward_kinematics(dict(zip(names, row)))
+        assert list(frame.point) == pytest.approx(matrices[b, :3, 3].tolist())
+        assert list(frame.xaxis) == pytest.approx(matrices[b, :3, 0].tolist())
+        assert list(frame.yaxis) == pytest.approx(matrices[b, :3, 1].tolist())
+
+
+def test_random_configurations_within_limits(urdf_file):
+    robot = RobotModel.from_urdf_file(urdf_file)
+    names = robot.get_configurable_joint_names()
+    q_batch = robot.random_configurations(10)
+    assert q_batch.shape == (10, len(names))
+    for j, name in enumerate(names):
+        limit = robot.get_joint_by_name(name).limit
+        if not limit:
+            continue
+        assert (q_batch[:, j] >= limit.lower).all()
+        assert (q_batch[:, j] <= limit.upper).all()
+
+
 # ==============================================================================
 # Main
 # ==============================================================================